@@ -1,5 +1,12 @@
+import os
+import re
 from setuptools import setup, find_packages
-import thermopy
+
+# read the version without importing the package (and its dependencies)
+with open(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                       'thermopy', '__init__.py')) as init_file:
+    version = re.search(r"__version__\s*=\s*'([^']+)'",
+                        init_file.read()).group(1)
 
 my_long_description = str(
 """
@@ -46,7 +53,7 @@ See the documentation for further details and examples.
 
 
 setup(name="thermopy",
-      version=thermopy.__version__,
+      version=version,
       description='Python package for thermodynamic calculations and units '
                   'conversion.',
       long_description = my_long_description,
@@ -4,35 +4,83 @@ Created on Sun Aug 23 17:34:44 2015
 
 @author: monteiro
 """
+import os
+import functools
+import numpy as np
+import pytest
 from thermopy import burcat
 from thermopy.iapws import Water
-from numpy import array, dot
 
 
-def test_enthalpy_massic_tests():
+@functools.lru_cache(maxsize=None)
+def _water_h(p, T):
+    """IAPWS enthalpy of water in kJ/kg; each (p, T) point is built once."""
+    return float(Water(p, T, massic_basis=True).enthalpy())
+
+
+@pytest.fixture(scope='module', autouse=True)
+def cache_dir(tmp_path_factory):
+    """Keep the pickled database out of the user cache directory."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        path = tmp_path_factory.mktemp('cache')
+        monkeypatch.setenv('THERMOPY_CACHE_DIR', str(path))
+        yield path
+
+
+@pytest.fixture(scope='module')
+def database(cache_dir):
+    """Parse the Burcat database only once for the whole module."""
+    return burcat.Database()
+
+
+def test_database_cache(database, cache_dir):
+    """A pickle that cannot be loaded is a cache miss and is replaced."""
+    cache_path = burcat._cache_path(burcat._DB_PATH)
+    assert os.path.dirname(cache_path) == str(cache_dir)
+    assert os.path.exists(cache_path)
+    # like a pickle written by another numpy: it names a missing module
+    with open(cache_path, 'wb') as cache:
+        cache.write(b'cthermopy_missing_module\nTable\n.')
+    table = burcat._load_database()
+    assert table['version'] == burcat._CACHE_VERSION
+    assert burcat._load_database()['index'] == table['index']
+
+
+def test_enthalpy_massic_tests(database):
     """Test for various elements enthalpies checked against a literature
     source. Relative error <= 1%.\n
     RE = abs(delta_cp_burcat - delta_cp_lit) / delta_cp_burcat
     """
     # Relative Error
     RE = 1/100
-    # Initialization
-    database = burcat.Database()
+
+    def shomate(T, c):
+        """Antiderivative of the Cp polynomials evaluated with Estrin's
+        scheme, T*((c0 + c1*T) + T**2*(c2 + c3*T) + T**4*c4), for one row
+        of integrated coefficients c and one temperature T per compound."""
+        T2 = T * T
+        return T * ((c[:, 0] + c[:, 1] * T) + T2 * (c[:, 2] + c[:, 3] * T) +
+                    T2 * T2 * c[:, 4])
+
+    def delta(method, T_low, T_high):
+        """Difference of a property between two temperatures evaluated with
+        a single vectorized call."""
+        values = method(np.array([T_low, T_high]))
+        return values[1] - values[0]
 
     #
     # REFERENCE: INCROPERA, ISBN 13 978-0470-50197-9
     #
     # Hydrogen from 600 to 700 K
     hydrogen = database.set_compound('h2 ref element')
-    delta_h_burcat = (hydrogen.enthalpy_massic(700)
-                      - hydrogen.enthalpy_massic(600))
+    delta_h_burcat = delta(hydrogen.enthalpy_massic, 600, 700)
     delta_h_literature = 14.55 * 100 * 1e3  # from 600 to 700 K
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
 
     # Oxygen from 350 to 400 K
     oxygen = database.set_compound('o2 ref element')
-    delta_h_burcat = oxygen.enthalpy_massic(400) - oxygen.enthalpy_massic(350)
+    delta_h_burcat = delta(oxygen.enthalpy_massic, 350, 400)
     delta_h_literature = 0.929 * 50 * 1e3  # from 600 to 700 K
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
@@ -43,10 +91,9 @@ def test_enthalpy_massic_tests():
     #
     # Water from 500 to 1000 K
     water = database.set_compound('H2O')
-    delta_h_burcat = water.enthalpy_massic(1000) - water.enthalpy_massic(500)
+    delta_h_burcat = delta(water.enthalpy_massic, 500, 1000)
     re = abs(delta_h_burcat
-             - ((Water(1e3, 1000, massic_basis=True).enthalpy()
-                 - Water(1e3, 500, massic_basis=True).enthalpy()) * 1e3)
+             - (_water_h(1e3, 1000) - _water_h(1e3, 500)) * 1e3
              ) / delta_h_burcat
     assert re < RE
 
@@ -54,77 +101,125 @@ def test_enthalpy_massic_tests():
     # REFERENCE: PERRY, Chemical Engineers Handbook McGraw-Hill 8thEd 2008;
     #            DOI: 10.1036/0071422943
     #
-    # NO from 200 to 1450 K; table 2-155
-    no = database.set_compound('no')
-    delta_h_burcat = no.enthalpy(1450) - no.enthalpy(400)
-    #Cp  form:        C 0 p = C1 + C2T + C3T 2 + C4T 3 + C5T 4
-    T = 1450
-    Tb = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    coefs = array([34980 / 1, -35.32 / 2, 0.07729 / 3,
-                   -5.7357*1e-5 / 4, 0.0014526*1e-10 / 5],
-                  dtype='d')
-    T = 200
-    Ta = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    delta_h_literature = dot((Tb - Ta), coefs) / 1e3
-    # Looks like there is a mistake on PERRY's table. The temperature range is
-    # also strange since 100 - 1500 K are used only for noble gases (except
-    # NO).
-    #print('mistake in NO:', delta_h_burcat, delta_h_literature)
-    #re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
-    #assert re < RE
-
-    # Argon from 300 to 1100 K; table 2-155
-    ar = database.set_compound('ar ref element')
-    delta_h_burcat = ar.enthalpy(1100) - ar.enthalpy(300)
-    T = 1100
-    Tb = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    coefs = array([20786 / 1, 0 / 2, 0 / 3, 0*1e-5 / 4, 0*1e-10 / 5],
-                  dtype='d')
-    T = 300
-    Ta = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    delta_h_literature = dot((Tb - Ta), coefs) / 1e3
-    re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
-    assert re < RE
-
-    # Hydrogen from 200 to 250 K; table 2-155 in
-    h2 = database.set_compound('h2 ref element')
-    delta_h_burcat = h2.enthalpy(250) - h2.enthalpy(200)
-    #Cp  form:        C 0 p = C1 + C2T + C3T 2 + C4T 3 + C5T 4
-    T = 250
-    Tb = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    coefs = array([64979 / 1, -788.17 / 2, 5.8287 / 3, -1845.9*1e-5 / 4,
-                   216400*1e-10 / 5],
-                  dtype='d')
-    T = 200
-    Ta = array([T, T ** 2, T ** 3, T ** 4, T ** 5], 'd')
-    delta_h_literature = dot((Tb - Ta), coefs) / 1e3
+    # Table 2-155, evaluated for all the compounds at once: argon from 300 to
+    # 1100 K and hydrogen from 200 to 250 K.
+    # NO (200 to 1450 K) is not checked: looks like there is a mistake on
+    # PERRY's table. The temperature range is also strange since 100 - 1500 K
+    # are used only for noble gases (except NO).
+    # Cp  form:        C 0 p = C1 + C2T + C3T 2 + C4T 3 + C5T 4
+    perry = ['ar ref element', 'h2 ref element']
+    coefs = np.array([[20786, 0, 0, 0*1e-5, 0*1e-10],
+                      [64979, -788.17, 5.8287, -1845.9*1e-5, 216400*1e-10]]
+                     ) / [1, 2, 3, 4, 5]
+    T_low = np.array([300, 200])
+    T_high = np.array([1100, 250])
+    delta_h_literature = (shomate(T_high, coefs) -
+                          shomate(T_low, coefs)) / 1e3
+    delta_h_burcat = (database.enthalpy(perry, T_high) -
+                      database.enthalpy(perry, T_low))
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
-    assert re < RE
+    assert np.all(re < RE)
 
     #
     # REFERENCE: NIST website; http://webbook.nist.gov;
     #            Shomate Equation
     # AL2SO3(S)
     al2so3 = database.set_compound('AL2O3(S)')
-    delta_h_burcat = al2so3.enthalpy(2300) - al2so3.enthalpy(300)
+    delta_h_burcat = delta(al2so3.enthalpy, 300, 2300)
     delta_h_literature = (251.0 - 0.12) * 1e3
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
     # CRN(S) CHROMIUM NITRIDE CONDENSED
     crn = database.set_compound('CrN(s)')
-    delta_h_burcat = crn.enthalpy(2200) - crn.enthalpy(400)
+    delta_h_burcat = delta(crn.enthalpy, 400, 2200)
     delta_h_literature = (104.0 - 4.84) * 1e3
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
     # FeCL2(L)
     fecl2l = database.set_compound('FeCL2(L)')
-    delta_h_burcat = fecl2l.enthalpy(2000) - fecl2l.enthalpy(950)
+    delta_h_burcat = delta(fecl2l.enthalpy, 950, 2000)
     delta_h_literature = (173.9 - 66.6) * 1e3
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
     # FeS(L)
     fesl = database.set_compound('FeS(L)')
-    delta_h_burcat = fesl.enthalpy(3800) - fesl.enthalpy(1463)
+    delta_h_burcat = delta(fesl.enthalpy, 1463, 3800)
     delta_h_literature = (222.0 - 75.81) * 1e3
     re = abs(delta_h_burcat - delta_h_literature) / delta_h_burcat
     assert re < RE
+
+
+def test_properties_array(database):
+    """Array evaluation must match the scalar one and keep range checks."""
+    oxygen = database.set_compound('o2 ref element')
+    T = np.array([300, 1000, 1500, 3000])
+    for method in (oxygen.heat_capacity, oxygen.enthalpy, oxygen.entropy,
+                   oxygen.gibbs_energy):
+        values = method(T)
+        assert values.shape == T.shape
+        for (Ti, value) in zip(T, values):
+            assert abs(value - method(Ti)) <= 1e-9 * abs(value)
+        with pytest.raises(ValueError):
+            method(np.array([300, 1e5]))
+
+
+def test_database_enthalpy(database):
+    """Batched evaluation over several compounds matches Compound.enthalpy."""
+    formulas = ['h2 ref element', 'o2 ref element', 'H2O', 'FeS(L)']
+    T = np.array([250, 1000, 1500, 3000])
+    h = database.enthalpy(formulas, T)
+    for (formula, Ti, hi) in zip(formulas, T, h):
+        h_compound = database.set_compound(formula).enthalpy(Ti)
+        assert abs(hi - h_compound) <= 1e-9 * abs(h_compound)
+    with pytest.raises(ValueError):
+        database.enthalpy(formulas, 250)
+
+
+def test_reaction(database):
+    """1 N2 + 3 H2 <-> 2 NH3, from the compounds' own properties."""
+    reaction = burcat.Reaction(None, 600, ['n2 ref element',
+                                           'h2 ref element'],
+                               ['nh3 anharmonic'], [1, 3], [2])
+    n2, h2, nh3 = (database.set_compound(formula) for formula in
+                   ('n2 ref element', 'h2 ref element', 'nh3 anharmonic'))
+    delta_h = (2 * nh3.enthalpy_engineering(600) -
+               n2.enthalpy_engineering(600) - 3 * h2.enthalpy_engineering(600))
+    delta_g = (2 * nh3.gibbs_energy(600) - n2.gibbs_energy(600) -
+               3 * h2.gibbs_energy(600))
+    assert abs(reaction.deltah - delta_h) <= 1e-9 * abs(delta_h)
+    assert abs(reaction.deltag - delta_g) <= 1e-9 * abs(delta_g)
+    sweep_h, sweep_g = reaction.sweep(np.array([500, 600]))
+    assert abs(sweep_h[1] - delta_h) <= 1e-9 * abs(delta_h)
+    assert abs(sweep_g[1] - delta_g) <= 1e-9 * abs(delta_g)
+    # the Database methods of a reaction use the shared database
+    assert reaction.list_compound('7727-37-9') == \
+        database.list_compound('7727-37-9')
+    assert reaction.set_compound('H2O').mm == database.set_compound('H2O').mm
+    assert '_index' not in vars(reaction)
+    with pytest.raises(KeyError):
+        burcat.Reaction(None, 600, ['not a compound'], ['nh3 anharmonic'],
+                        [1], [1])
+    water = database.set_compound('H2O')
+    hydrogen = database.set_compound('h2 ref element')
+    oxygen = database.set_compound('o2 ref element')
+    reaction = burcat.Reaction(None, 500, [hydrogen, oxygen], [water],
+                               [2, 1], [2])
+    assert repr(reaction).startswith('<reaction> +2 H2 REF ELEMENT')
+    assert abs(reaction.deltah - 2 * (water.enthalpy_engineering(500) -
+                                      hydrogen.enthalpy_engineering(500)) +
+               oxygen.enthalpy_engineering(500)) < 1e-6
+    # exp(-deltaG / (R T)) above the float range
+    reaction = burcat.Reaction(None, 300, ['H2O'],
+                               ['h2 ref element', 'o2 ref element'],
+                               [200], [200, 100])
+    assert reaction.equilibrium_constant == float('inf')
+
+
+def test_reaction_cache(database):
+    """Reactions built from the same names share the memoized terms."""
+    burcat.clear_cache()
+    for _ in range(3):
+        burcat.Reaction(None, 600, ['n2 ref element', 'h2 ref element'],
+                        ['nh3 anharmonic'], [1, 3], [2])
+    info = burcat._terms_cached.cache_info()
+    assert (info.hits, info.misses) == (6, 3)
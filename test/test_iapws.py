@@ -4,6 +4,8 @@ Created on Tue Aug 18 09:29:56 2015
 
 @author: monteiro
 """
+import numpy as np
+import pytest
 from thermopy.iapws import Water
 from thermopy.units import Pressure, Temperature
 
@@ -233,3 +235,25 @@ def triple_point_test():
     triple_water = Water(triple_pressure, triple_temperature)
     assert triple_water.internal_energy() < 1e-5
     assert triple_water.entropy() < 1e-5
+
+
+def test_saturation_array():
+    w = Water(1e5, 373.15)
+    T = np.array([300., 450., 500., 600.])
+    p = w.pressure_saturation(T)
+    assert p.shape == T.shape
+    assert np.allclose(p, [w.pressure_saturation(t) for t in T],
+                       rtol=1e-15, atol=0)
+    assert np.allclose(w.temperature_saturation(p), T, rtol=1e-8, atol=0)
+    with pytest.raises(ValueError):
+        w.pressure_saturation(np.array([300., 700.]))
+
+
+def test_zero_pressure_region2():
+    # numpy's log gives the p -> 0 limit instead of a math domain error
+    w = Water(0, 700)
+    with np.errstate(divide='ignore'):
+        assert w.gibbs_energy() == -np.inf
+        assert w.entropy() == np.inf
+    with pytest.raises(ValueError):
+        Water(0, 300).speed_of_sound()
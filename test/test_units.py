@@ -4,7 +4,8 @@ Created on Tue Aug 18 08:38:33 2015
 
 @author: monteiro
 """
-from thermopy.units import Pressure, Temperature
+import pytest
+from thermopy.units import Energy, Pressure, Temperature
 
 
 def test_units():
@@ -15,3 +16,13 @@ def test_units():
     pressuremmhg = Pressure(760).unit('torr')
     pressureatm = Pressure(1).unit('atm')
     assert pressuremmhg == pressureatm
+
+
+def test_unit_codes():
+    """Unknown unit codes are rejected, the default code is the identity."""
+    assert Energy(1).unit() == 1
+    assert Energy(1).unit('btu') == Energy(1).unit('Btu')
+    with pytest.raises(ValueError):
+        Pressure(1).unit('mbar')
+    with pytest.raises(ValueError):
+        Temperature(1).unit('R')
@@ -5,6 +5,22 @@ Modules:
     Iapws: water and steam thermodynamic database.
     Nasa9polynomials: nasa 9 term polynomials database.
     Units: units conversion database.
+
+Modules are imported on first attribute access so that ``import thermopy``
+does not load any of the databases.
 """
 
+import importlib
+
 __version__ = '0.5.4'
+__all__ = ['burcat', 'constants', 'iapws', 'nasa9polynomials', 'units']
+
+
+def __getattr__(name):
+    u"""Import a submodule the first time it is accessed."""
+    if name in __all__:
+        module = importlib.import_module('.' + name, __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError("module {0!r} has no attribute {1!r}".format(
+        __name__, name))
@@ -17,11 +17,78 @@ instead.
 """
 
 import os
-from xml.etree.ElementTree import parse
+import sys
+import math
+import hashlib
+import itertools
+import functools
+import pickle
+from xml.etree.ElementTree import parse, iterparse
 import numpy as np
 import thermopy.units as units
 from thermopy.constants import ideal_gas_constant
-_R = ideal_gas_constant[0]
+_R = ideal_gas_constant.value
+_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)),
+                        'databases', 'burcat_thr.xml')
+# divisors of the coefficients in the integral of cp/R
+_H_SCALE = np.array([1, 2, 3, 4, 5, 1], dtype='d')
+# divisors of the coefficients in the integral of cp/(R T)
+_S_SCALE = np.array([1, 1, 2, 3, 4, 1, 1], dtype='d')
+# bump whenever the layout returned by _parse_database changes
+_CACHE_VERSION = 2
+# number of (formula, temperature) evaluations memoized for reactions
+_PROPERTY_CACHE_SIZE = 4096
+
+
+def _temperature(T):
+    """
+    Returns T as a float if it is a scalar, so that the polynomials are
+    evaluated with scalar arithmetic, or as an array of doubles otherwise.
+    """
+    if np.ndim(T) == 0:
+        return float(T)
+    return np.asarray(T, dtype='d')
+
+
+def _select(low, high, T):
+    """
+    Returns the low temperature coefficients where T <= 1000 and the high
+    temperature ones elsewhere. For an array of temperatures the result has
+    one column of coefficients per temperature, blended with a mask, so
+    the polynomial is evaluated once instead of once per set.
+    """
+    if np.ndim(T) == 0:
+        return low if T <= 1000 else high
+    shape = np.shape(low) + (1,) * np.ndim(T)
+    return np.where(T <= 1000, np.reshape(low, shape), np.reshape(high, shape))
+
+
+def _nasa7_cp_over_r(a, T):
+    """
+    Dimensionless heat capacity cp/R of the 7 coefficient NASA polynomial,
+    unrolled in Horner form. T may be a scalar or an array.
+    """
+    return a[0] + T * (a[1] + T * (a[2] + T * (a[3] + T * a[4])))
+
+
+def _nasa7_h_over_rt(a, T):
+    """
+    Dimensionless enthalpy h/(R T) of the 7 coefficient NASA polynomial,
+    unrolled in Horner form. a holds the first six coefficients already
+    divided by _H_SCALE along its first axis, so that T may be a scalar or
+    an array.
+    """
+    return a[0] + T * (a[1] + T * (a[2] + T * (a[3] + T * a[4]))) + a[5] / T
+
+
+def _nasa7_s_over_r(a, T):
+    """
+    Dimensionless entropy s/R of the 7 coefficient NASA polynomial: the
+    logarithmic term plus a Horner chain. a holds the coefficients already
+    divided by _S_SCALE along its first axis.
+    """
+    return (a[0] * np.log(T) +
+            T * (a[1] + T * (a[2] + T * (a[3] + T * a[4]))) + a[6])
 
 
 class Compound(object):
@@ -42,6 +109,12 @@ class Compound(object):
     Units are in SI on a molar basis.
     """
 
+    __slots__ = ('cas', 'description', '_reference', 'formula', '_elements',
+                 'aggr_state', '_T_limit_low', '_T_limit_high', '_T_min',
+                 '_T_max', '_calc_quality', 'mm', '_coefs', '_low_coefs',
+                 '_high_coefs', '_low_hs', '_high_hs', '_low_h', '_high_h',
+                 '_low_s', '_high_s', 'h_formation')
+
     def __init__(self, cas, description, reference, formula, elements,
                  aggr_state, T_limit_low, T_limit_high, calc_quality,
                  mm, low_coefs, high_coefs, h_formation):
@@ -63,10 +136,29 @@ class Compound(object):
         self.aggr_state = aggr_state
         self._T_limit_low = T_limit_low
         self._T_limit_high = T_limit_high
+        # the low coefficients cover [T_limit_low, 1000] and the high ones
+        # (1000, T_limit_high]; their union is the interval [_T_min, _T_max]
+        if T_limit_low <= 1000:
+            self._T_min = T_limit_low
+        else:
+            self._T_min = np.nextafter(1000., np.inf)
+        self._T_max = max(T_limit_high, 1000.)
         self._calc_quality = calc_quality
         self.mm = mm
-        self._low_coefs = low_coefs
-        self._high_coefs = high_coefs
+        # both sets of coefficients share one contiguous block
+        self._coefs = np.array([low_coefs, high_coefs], dtype='d')
+        self._low_coefs = self._coefs[0]
+        self._high_coefs = self._coefs[1]
+        # enthalpy and entropy coefficients of each set, back to back, so
+        # that both are selected at once
+        self._low_hs = np.concatenate((self._low_coefs[:6] / _H_SCALE,
+                                       self._low_coefs / _S_SCALE))
+        self._high_hs = np.concatenate((self._high_coefs[:6] / _H_SCALE,
+                                        self._high_coefs / _S_SCALE))
+        self._low_h = self._low_hs[:6]
+        self._high_h = self._high_hs[:6]
+        self._low_s = self._low_hs[6:]
+        self._high_s = self._high_hs[6:]
         self.h_formation = h_formation
 
     def density_ideal_gas(self, p, T):
@@ -75,54 +167,62 @@ class Compound(object):
         """
         return units.Pressure(p) * self.mm / _R / units.Temperature(T)
 
-    def heat_capacity(self, T):
+    def _check_range(self, T):
         """
-        Calculates the specific heat capacity in J/(mol K).
+        Raises ValueError if any temperature falls outside the ranges covered
+        by the low and high temperature coefficients.
         """
-        Ta = np.array([1, T, T ** 2, T ** 3, T ** 4], dtype='d')
-        if T >= self._T_limit_low and T <= 1000:
-            return np.dot(self._low_coefs[:5], Ta) * _R
-        elif T > 1000 and T <= self._T_limit_high:
-            return np.dot(self._high_coefs[:5], Ta) * _R
-        else:
+        in_range = (T >= self._T_min) & (T <= self._T_max)
+        # a scalar comparison gives a bool that needs no reduction
+        if in_range is not True and not np.all(in_range):
             raise ValueError("Temperature out of range")
 
+    def _evaluate(self, kernel, low, high, T):
+        """
+        Checks the range of T and evaluates kernel once with the low or high
+        coefficients selected for each temperature.
+        """
+        self._check_range(T)
+        return kernel(_select(low, high, T), T)
+
+    def heat_capacity(self, T):
+        """
+        Calculates the specific heat capacity in J/(mol K). T may be a scalar
+        or an array of temperatures.
+        """
+        return self._evaluate(_nasa7_cp_over_r, self._low_coefs,
+                              self._high_coefs, _temperature(T)) * _R
+
     def heat_capacity_massic(self, T):
         """
         Computes the specific heat capacity in J/(kg K)
         for a given temperature.
         """
-        return self.cpo(T) / self.mm
+        return self.heat_capacity(T) / self.mm
 
-    def enthalpy(self, T):
+    def _sensible_enthalpy(self, T):
         """
-        Computes the sensible enthalpy in J/mol.
+        Computes h/(R T) for a scalar or an array of temperatures.
         """
-        Ta = np.array([1, T / 2, T ** 2 / 3, T ** 3 / 4, T ** 4 / 5, 1 / T],
-                      'd')
-        if T >= self._T_limit_low and T <= 1000:
-            partial = np.dot(self._low_coefs[:6], Ta) * _R * T
-        elif T > 1000 and T <= self._T_limit_high:
-            partial = np.dot(self._high_coefs[:6], Ta) * _R * T
-        else:
-            raise ValueError("Temperature out of range")
+        T = _temperature(T)
+        return T, self._evaluate(_nasa7_h_over_rt, self._low_h,
+                                 self._high_h, T)
 
-        return partial - self.h_formation
+    def enthalpy(self, T):
+        """
+        Computes the sensible enthalpy in J/mol. T may be a scalar or an
+        array of temperatures.
+        """
+        T, h = self._sensible_enthalpy(T)
+        return h * _R * T - self.h_formation
 
     def enthalpy_massic(self, T):
         """
-        Computes the sensible enthalpy in J/kg.
+        Computes the sensible enthalpy in J/kg. T may be a scalar or an
+        array of temperatures.
         """
-        Ta = np.array([1, T / 2, T ** 2 / 3, T ** 3 / 4, T ** 4 / 5, 1 / T],
-                      'd')
-        if T >= self._T_limit_low and T <= 1000:
-            partial = np.dot(self._low_coefs[:6], Ta) * _R * T / self.mm
-        elif T > 1000 and T <= self._T_limit_high:
-            partial = np.dot(self._high_coefs[:6], Ta) * _R * T / self.mm
-        else:
-            raise ValueError("Temperature out of range")
-
-        return partial - self.h_formation
+        T, h = self._sensible_enthalpy(T)
+        return h * _R * T / self.mm - self.h_formation
 
     def enthalpy_engineering(self, T):
         """
@@ -136,27 +236,80 @@ class Compound(object):
 
     def entropy(self, T):
         """
-        Computes enthropy in J/mol K.
+        Computes enthropy in J/mol K. T may be a scalar or an array of
+        temperatures.
         """
-        Ta = np.array([np.log(T), T, T ** 2 / 2, T ** 3 / 3, T ** 4 / 4, 0, 1],
-                      'd')
-        # right
-        if T >= self._T_limit_low and T <= 1000:
-            return np.dot(self._low_coefs, Ta) * _R
-        elif T > 1000 and T <= self._T_limit_high:
-            return np.dot(self._high_coefs, Ta) * _R
-        else:
+        return self._evaluate(_nasa7_s_over_r, self._low_s, self._high_s,
+                              _temperature(T)) * _R
+
+    def h_and_s(self, T):
+        """
+        Computes the sensible enthalpy in J/mol and the entropy in J/(mol K)
+        with a single range check and coefficient selection. T may be a
+        scalar or an array of temperatures.
+        """
+        T = _temperature(T)
+        self._check_range(T)
+        return self._h_s(T)
+
+    def _h_s(self, T):
+        """
+        h_and_s without the range check. Both polynomials are evaluated on
+        the same selection of coefficients.
+        """
+        a = _select(self._low_hs, self._high_hs, T)
+        h = _nasa7_h_over_rt(a[:6], T)
+        s = _nasa7_s_over_r(a[6:], T)
+        return h * _R * T - self.h_formation, s * _R
+
+    def _check_gibbs_range(self, T):
+        """
+        The Gibbs energy is not computed at the highest temperature. This
+        range is contained in the one of _check_range.
+        """
+        in_range = (T >= self._T_limit_low) & (T < self._T_limit_high)
+        if in_range is not True and not np.all(in_range):
             raise ValueError("Temperature out of range")
 
+    def _reaction_terms(self, T):
+        """
+        Total enthalpy and Gibbs energy in J/mol, the two contributions of
+        the compound to a reaction. T may be a scalar or an array.
+        """
+        self._check_gibbs_range(T)
+        h, s = self._h_s(T)
+        return self.h_formation + h, h - s * T
+
     def gibbs_energy(self, T):
         """
         Computes the Gibbs free energy from the sensible enthalpy in
-        J/mol.
+        J/mol. T may be a scalar or an array of temperatures.
         """
-        if T >= self._T_limit_low and T < self._T_limit_high:
-            return self.enthalpy(T) - self.entropy(T) * T
-        else:
-            raise ValueError("Temperature out of range")
+        T = _temperature(T)
+        self._check_gibbs_range(T)
+        h, s = self._h_s(T)
+        return h - s * T
+
+    # names used by the former Element class
+    @property
+    def elements(self):
+        return self._elements
+
+    @property
+    def Tmin_(self):
+        return self._T_limit_low
+
+    @property
+    def _Tmax(self):
+        return self._T_limit_high
+
+    @property
+    def hfr(self):
+        return self.h_formation
+
+    @property
+    def inp_name(self):
+        return self.formula
 
     def __repr__(self):
         return """<element> %s""" % (self.formula)
@@ -168,6 +321,165 @@ class Compound(object):
         return u"""<element> %s""" % (self.formula)
 
 
+# Element was a duplicate of Compound
+Element = Compound
+
+
+def _read_phase(cas, description, phase):
+    """
+    Reads a <phase> element of the Burcat's database. Returns a tuple with the
+    scalar arguments of Compound (except its formula and its coefficients)
+    and the low and high temperature coefficients.
+    """
+    elements = [(elem.get('name'), int(elem.get('num_of_atoms')))
+                for elem in phase.find('elements')]
+    aggr_state = str(phase.find('phase').text)
+    temp_limit = phase.find('temp_limit')
+    T_limit_low = float(temp_limit.get('low'))
+    T_limit_high = float(temp_limit.get('high'))
+    calc_quality = phase.find('calc_quality')
+    if calc_quality is not None:
+        calc_quality = str(calc_quality.text)
+    mm = float(phase.find('molecular_weight').text) / 1e3
+    coefs = phase.find('coefficients')
+    range_1000_to_Tmax = coefs.find('range_1000_to_Tmax').findall('coef')
+    range_Tmin_to_1000 = coefs.find('range_Tmin_to_1000').findall('coef')
+    if len(range_1000_to_Tmax) != 7 or len(range_Tmin_to_1000) != 7:
+        raise ValueError("A phase must have 7 coefficients per range")
+    high_coefs = np.fromiter((float(a_term.text)
+                              for a_term in range_1000_to_Tmax), 'd', 7)
+    low_coefs = np.fromiter((float(a_term.text)
+                             for a_term in range_Tmin_to_1000), 'd', 7)
+    h_formation = float(coefs.find('hf298_div_r').text) * _R
+    # the reference is never stored at this level of the xml file
+    return ((cas, description, None, elements, aggr_state, T_limit_low,
+             T_limit_high, calc_quality, mm, h_formation),
+            low_coefs, high_coefs)
+
+
+def _parse_database(path):
+    """
+    Streams through the xml file once and returns the database as a
+    dictionary of parallel tables, one row per compound:
+
+        index: maps every upper case formula to its row.
+        info: scalar arguments of Compound for every row.
+        low_coefs, high_coefs: (N, 7) arrays of coefficients.
+        T_limits: (N, 2) array of the lowest and highest temperatures.
+        h_formation: (N,) array of heats of formation.
+        phases: list of (CAS, formula) for every phase, in file order.
+        cas: maps every CAS number to its formulas, in file order.
+
+    Only the first phase found for each formula is kept and phases that
+    cannot be read are skipped, as a linear search of the file would do.
+    """
+    index = {}
+    info = []
+    low_coefs = []
+    high_coefs = []
+    phases = []
+    by_cas = {}
+    for (event, specie) in iterparse(path):
+        if specie.tag != 'specie':
+            continue
+        cas = str(specie.get('CAS'))
+        description = specie.find(
+            'formula_name_structure/formula_name_structure_1')
+        if description is not None:
+            description = str(description.text)
+        for phase in specie.findall('phase'):
+            formulas = phase.findall('formula')
+            if not formulas or formulas[0].text is None:
+                continue
+            phases.append((cas, formulas[0].text))
+            by_cas.setdefault(cas, []).append(formulas[0].text)
+            for each_formula in formulas:
+                if each_formula.text is None:
+                    continue
+                key = each_formula.text.upper()
+                if key in index:
+                    continue
+                try:
+                    row = _read_phase(cas, description, phase)
+                except (AttributeError, TypeError, ValueError, IndexError):
+                    continue
+                index[key] = len(info)
+                info.append(row[0])
+                low_coefs.append(row[1])
+                high_coefs.append(row[2])
+        # the tree is not needed anymore
+        specie.clear()
+    return {'index': index,
+            'info': info,
+            'low_coefs': np.array(low_coefs, dtype='d').reshape(-1, 7),
+            'high_coefs': np.array(high_coefs, dtype='d').reshape(-1, 7),
+            'T_limits': np.array([i[5:7] for i in info],
+                                 dtype='d').reshape(-1, 2),
+            'h_formation': np.array([i[9] for i in info], dtype='d'),
+            'phases': phases,
+            'cas': by_cas}
+
+
+def _cache_dir():
+    """
+    Returns the directory of the pickled database: THERMOPY_CACHE_DIR if it
+    is set, otherwise thermopy in the user cache directory.
+    """
+    cache_dir = os.environ.get('THERMOPY_CACHE_DIR')
+    if cache_dir:
+        return cache_dir
+    return os.path.join(
+        os.environ.get('XDG_CACHE_HOME',
+                       os.path.join(os.path.expanduser('~'), '.cache')),
+        'thermopy')
+
+
+def _cache_path(path):
+    """
+    Returns the path of the pickle of the xml file in the cache directory.
+    Its name is a hash of the location, size and modification time of the
+    xml file and of the python and numpy versions, so a modified database
+    or another environment sharing the directory never hits a stale cache.
+    """
+    stat = os.stat(path)
+    key = '{0}:{1}:{2}:{3}:{4}:{5}'.format(
+        os.path.abspath(path), stat.st_size, stat.st_mtime_ns,
+        _CACHE_VERSION, sys.version_info[:2], np.__version__)
+    return os.path.join(_cache_dir(), 'burcat_{0}.pkl'.format(
+        hashlib.sha1(key.encode('utf-8')).hexdigest()[:16]))
+
+
+def _load_database(path=_DB_PATH, cache_path=None):
+    """
+    Returns the parsed database from its pickle in the cache directory if
+    it exists, otherwise parses the xml file and tries to store the pickle
+    for future use. A pickle that cannot be loaded is overwritten.
+    """
+    if cache_path is None:
+        cache_path = _cache_path(path)
+    try:
+        with open(cache_path, 'rb') as cache:
+            database = pickle.load(cache)
+        if database.get('version') == _CACHE_VERSION:
+            return database
+    except Exception:
+        # unreadable, truncated or written by an incompatible environment
+        # (e.g. a module that cannot be imported here): a cache miss
+        pass
+    database = _parse_database(path)
+    database['version'] = _CACHE_VERSION
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        temporary_path = cache_path + '.' + str(os.getpid())
+        with open(temporary_path, 'wb') as cache:
+            pickle.dump(database, cache, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, cache_path)
+    except OSError:
+        # without a writable cache the xml is parsed every time
+        pass
+    return database
+
+
 class Database(object):
     """
     Class that reads the Alexander Burcat's thermochemical database
@@ -177,12 +489,30 @@ class Database(object):
     def __init__(self):
         """
         The database file is read when the class is instantiated.
-        This is terribly slow as the database is more than 2MB.
-        Create the instance and the elements at boot, otherwise be
-        prepared to face huge computation times.
+        The xml file is more than 2MB so it is parsed once and its contents
+        are cached as a pickle in the user cache directory (or in
+        THERMOPY_CACHE_DIR if set); later instances (and later sessions) load
+        the pickle instead. Lookups are then dictionary accesses.
         """
-        self.db = parse(str(os.path.dirname(os.path.dirname(__file__)) +
-                        '/databases/burcat_thr.xml')).getroot()
+        table = _load_database()
+        self._index = table['index']
+        self._info = table['info']
+        self._low_coefs = table['low_coefs']
+        self._high_coefs = table['high_coefs']
+        self._T_limits = table['T_limits']
+        self._h_formation = table['h_formation']
+        self._low_h = self._low_coefs[:, :6] / _H_SCALE
+        self._high_h = self._high_coefs[:, :6] / _H_SCALE
+        self._phases = table['phases']
+        self._by_cas = table['cas']
+        self._db = None
+
+    @property
+    def db(self):
+        """Root of the xml tree. It is only parsed if requested."""
+        if self._db is None:
+            self._db = parse(_DB_PATH).getroot()
+        return self._db
 
     def list_compound(self, cas_or_formula):
         """
@@ -198,194 +528,232 @@ class Database(object):
         else:
             cas = cas_or_formula
             formula = None
-        matches = []
         if cas is not None:
-            for specie in self.db.findall('specie'):
-                if cas == str(specie.get('CAS')):
-                    try:
-                        specie.find('phase')
-                        for phases in specie.findall('phase'):
-                            matches.append(phases.find('formula').text)
-                    except:
-                        pass
-            return matches
+            return list(self._by_cas.get(cas, []))
         elif formula is not None:
             formula = formula.upper()
-            for specie in self.db.findall('specie'):
-                try:
-                    specie.find('phase')
-                    for phases in specie.findall('phase'):
-                        if formula in phases.find('formula').text.upper():
-                            matches.append(phases.find('formula').text)
-                except:
-                    pass
-            return matches
+            return [f for (c, f) in self._phases if formula in f.upper()]
 
     def set_compound(self, formula):
         """
         Returns an Element instance given the name of the element.
         """
         formula = formula.upper()
-        for specie in self.db.findall('specie'):
-            try:
-                specie.findall('phase')
-                for each_phase in specie.findall('phase'):
-                    try:
-                        each_phase.findall('formula')
-                        for each_formula in each_phase.findall('formula'):
-                            if formula == each_formula.text.upper():
-                                cas = str(specie.get('CAS'))
-                                try:
-                                    specie.find('formula_name_structure').find(
-                                        'formula_name_structure_1')
-                                    description = str(
-                                        specie.find(
-                                            'formula_name_structure').find(
-                                                'formula_name_structure_1'
-                                            ).text)
-                                except:
-                                    description = None
-                                try:
-                                    specie.find('formula_name_structure_1')
-                                    reference = str(specie.find(
-                                        'formula_name_structure_1').text)
-                                except:
-                                    reference = None
-                                    elements = []
-                                    for elem in each_phase.find('elements'):
-                                        elements.append((elem.get('name'),
-                                                         int(elem.get(
-                                                             'num_of_atoms'))))
-                                    aggr_state = str(each_phase.find(
-                                        'phase').text)
-                                    T_limit_low = float(each_phase.find(
-                                        'temp_limit').get('low'))
-                                    T_limit_high = float(each_phase.find(
-                                        'temp_limit').get('high'))
-                                    try:
-                                        each_phase.find('calc_quality').text
-                                        calc_quality = str(each_phase.find(
-                                            'calc_quality').text)
-                                    except:
-                                        calc_quality = None
-                                    mm = float(each_phase.find(
-                                        'molecular_weight').text) / 1e3
-                                    coefs = each_phase.find('coefficients')
-                                    high_coefs = np.empty((7), dtype='d')
-                                    low_coefs = np.empty((7), dtype='d')
-                                    range_1000_to_Tmax = coefs.find(
-                                        'range_1000_to_Tmax').findall('coef')
-                                    for (index, a_term) in enumerate(
-                                            range_1000_to_Tmax):
-                                        high_coefs[index] = a_term.text
-                                    range_Tmin_to_1000 = coefs.find(
-                                        'range_Tmin_to_1000').findall('coef')
-                                    for (index, a_term) in enumerate(
-                                            range_Tmin_to_1000):
-                                        low_coefs[index] = a_term.text
-                                    h_formation = float(
-                                        coefs.find('hf298_div_r').text) * _R
-                                    return Compound(
-                                        cas,
-                                        description,
-                                        reference,
-                                        formula,
-                                        elements,
-                                        aggr_state,
-                                        T_limit_low,
-                                        T_limit_high,
-                                        calc_quality,
-                                        mm,
-                                        low_coefs,
-                                        high_coefs,
-                                        h_formation)
-                    except:
-                        pass
-            except:
-                pass
-        return None
-
-
-# inherits from Elementdb so there is no need to slow down reading
-# burcat.xml all the time
+        try:
+            row = self._index[formula]
+        except KeyError:
+            return None
+        (cas, description, reference, elements, aggr_state, T_limit_low,
+         T_limit_high, calc_quality, mm, h_formation) = self._info[row]
+        return Compound(cas, description, reference, formula, elements,
+                        aggr_state, T_limit_low, T_limit_high, calc_quality,
+                        mm, self._low_coefs[row], self._high_coefs[row],
+                        h_formation)
+
+    def enthalpy(self, formulas, T):
+        """
+        Computes the sensible enthalpy in J/mol of several compounds in a
+        single vectorized evaluation. T is either one temperature for all the
+        compounds or one temperature per compound.
+        """
+        rows = np.array([self._index[formula.upper()]
+                         for formula in formulas], dtype=int)
+        T = np.broadcast_to(np.asarray(T, dtype='d'), rows.shape)
+        T_low = self._T_limits[rows, 0]
+        T_high = self._T_limits[rows, 1]
+        if not np.all(((T >= T_low) & (T <= 1000)) |
+                      ((T > 1000) & (T <= T_high))):
+            raise ValueError("Temperature out of range")
+        c = np.where((T <= 1000)[:, np.newaxis], self._low_h[rows],
+                     self._high_h[rows])
+        return (_nasa7_h_over_rt(c.T, T) * _R * T -
+                self._h_formation[rows])
+
+
+# Elementdb was a duplicate of Database
+Elementdb = Database
+
+_default_database = None
+
+
+def _get_database():
+    """
+    Returns the process wide Database shared by the reactions. It is
+    loaded on first use and never modified afterwards.
+    """
+    global _default_database
+    if _default_database is None:
+        _default_database = Database()
+    return _default_database
+
+
+def _reaction_terms(formula, T):
+    """
+    Reaction terms of a compound of the shared database at T. The formula,
+    not the Compound, is the cache key, so all the reactions share entries.
+    """
+    return _get_database().set_compound(formula)._reaction_terms(T)
+
+
+_terms_cached = functools.lru_cache(_PROPERTY_CACHE_SIZE)(_reaction_terms)
+
+
+def clear_cache():
+    """
+    Forgets the compound properties memoized by the reactions.
+    """
+    _terms_cached.cache_clear()
+
+
+def set_cache_size(maxsize):
+    """
+    Sets how many (formula, temperature) evaluations are memoized by the
+    reactions. None means unbounded, 0 disables the cache. The cache is
+    emptied.
+    """
+    global _terms_cached
+    _terms_cached = functools.lru_cache(maxsize)(_reaction_terms)
+
+
+# a Database for backwards compatibility, but every lookup goes to the process
+# wide database so burcat.xml is not read again for each reaction
 class Reaction(Database):
     """Models a simple reaction. Example:\n
     1 N2 + 3 H2 <-> 2 NH3\n
     reaction1 = burcat.Reaction(None, 600, ['n2 ref element',
     'h2 ref element'], ['nh3 anharmonic'], [1, 3], [2])"""
     def __init__(self, p, T, reagents, products, rcoefs=None, pcoefs=None):
-        Elementdb.__init__(self)
+        self._database = _get_database()
         self.T = T
         self.p = p
         self.reagents = []
         self.products = []
+        # formulas of the compounds looked up by name, None for the Compound
+        # objects given directly, which may not match the database
+        self._reagent_formulas = []
+        self._product_formulas = []
         self._rcoefs = [abs(z) for z in rcoefs]
         self._pcoefs = [abs(z) for z in pcoefs]
 
         # error checking
         elements_in_reagents = set()
         for compound in reagents:
-            if isinstance(compound, Element):
-                self.reagents.append(compound)
-                elements_in_reagents.add(tuple(compound._elements))
-            elif isinstance(compound, str):
-                self.reagents.append(self.set_compound(compound))
-                elements_in_reagents.add(tuple(
-                    self.set_compound(compound)._elements))
+            formula = None
+            if isinstance(compound, str):
+                c = self.set_compound(compound)
+                if c is None:
+                    raise KeyError(compound)
+                formula = c.formula
+                compound = c
+            elif not isinstance(compound, Element):
+                continue
+            self.reagents.append(compound)
+            self._reagent_formulas.append(formula)
+            elements_in_reagents.update(name for (name, number)
+                                        in compound._elements)
         elements_in_products = set()
         for compound in products:
-            if isinstance(compound, Element):
-                self.products.append(compound)
-                elements_in_products.add(tuple(compound._elements))
-            elif isinstance(compound, str):
-                self.products.append(self.set_compound(compound))
-                elements_in_products.add(tuple(
-                    self.set_compound(compound)._elements))
-
-        if set([x[0] for comp in elements_in_products for x in comp]) !=      \
-           set([x[0] for comp in elements_in_reagents for x in comp]):
+            formula = None
+            if isinstance(compound, str):
+                c = self.set_compound(compound)
+                if c is None:
+                    raise KeyError(compound)
+                formula = c.formula
+                compound = c
+            elif not isinstance(compound, Element):
+                continue
+            self.products.append(compound)
+            self._product_formulas.append(formula)
+            elements_in_products.update(name for (name, number)
+                                        in compound._elements)
+
+        if elements_in_products != elements_in_reagents:
             raise Exception('Cannot balance equation with different'
                             'elements in reagents and products')
 
-        self.deltah = self._delta_enthalpy()
-        self.deltag = self._delta_gibbs_energy()
+        self.deltah, self.deltag = self._deltas()
         self.equilibrium_constant = self.equilibrium_constant()
 
-    def _delta_enthalpy(self, T=None):
-        """Reaction deltaH in J/mol"""
+    @property
+    def db(self):
+        """Root of the xml tree of the shared database."""
+        return self._database.db
+
+    def list_compound(self, cas_or_formula):
+        """Database.list_compound on the shared database."""
+        return self._database.list_compound(cas_or_formula)
+
+    def set_compound(self, formula):
+        """Database.set_compound on the shared database."""
+        return self._database.set_compound(formula)
+
+    def enthalpy(self, formulas, T):
+        """Database.enthalpy on the shared database."""
+        return self._database.enthalpy(formulas, T)
+
+    def _deltas(self, T=None):
+        """Reaction deltaH and deltaG in J/mol, in a single pass"""
         if T is not None:
             self.T = T
+        T = float(self.T)
         delta_h = 0
-        for (coefficient, compound) in zip(self._rcoefs, self.reagents):
-            delta_h = delta_h - coefficient * compound.enthalpy_engineering(
-                self.T)
-        for (coefficient, compound) in zip(self._pcoefs, self.products):
-            delta_h = delta_h + coefficient * compound.enthalpy_engineering(
-                self.T)
-        return delta_h
+        delta_g = 0
+        for (coefficient, compound, formula) in self._stoichiometry():
+            if formula is None:
+                h, g = compound._reaction_terms(T)
+            else:
+                h, g = _terms_cached(formula, T)
+            delta_h = delta_h + coefficient * h
+            delta_g = delta_g + coefficient * g
+        return delta_h, delta_g
+
+    def _stoichiometry(self):
+        """
+        Signed coefficient, compound and database formula (None if the
+        compound was given as an object) of every compound, reagents first
+        """
+        return itertools.chain(zip([-c for c in self._rcoefs], self.reagents,
+                                   self._reagent_formulas),
+                               zip(self._pcoefs, self.products,
+                                   self._product_formulas))
+
+    def sweep(self, T):
+        """
+        Reaction deltaH and deltaG in J/mol for an array of temperatures.
+        Every compound is evaluated once over the whole array.
+        """
+        T = _temperature(T)
+        delta_h = np.zeros(np.shape(T))
+        delta_g = np.zeros(np.shape(T))
+        for (coefficient, compound, formula) in self._stoichiometry():
+            h, g = compound._reaction_terms(T)
+            delta_h += coefficient * h
+            delta_g += coefficient * g
+        return delta_h, delta_g
+
+    def _delta_enthalpy(self, T=None):
+        """Reaction deltaH in J/mol"""
+        return self._deltas(T)[0]
 
     def _delta_gibbs_energy(self, T=None):
         """Reaction deltaG in J/mol"""
-        if T is not None:
-            self.T = T
-        deltag = 0
-        for (coef, comp) in zip(self._rcoefs, self.reagents):
-            deltag = deltag - coef * comp.gibbs_energy(self.T)
-        for (coef, comp) in zip(self._pcoefs, self.products):
-            deltag = deltag + coef * comp.gibbs_energy(self.T)
-        return deltag
+        return self._deltas(T)[1]
 
     def equilibrium_constant(self, T=None):
         """The equilibrium constant: K_eq = exp( - deltaG / (R * T))"""
         if T is not None:
             self.T = T
-        return np.exp(-1 * self.deltag / (_R * self.T))
+        try:
+            return math.exp(-self.deltag / (_R * self.T))
+        except OverflowError:
+            # the reaction is complete; numpy.exp gave inf as well
+            return math.inf
 
     def __repr__(self):
-        r = ''
-        for (reag, coef) in zip(self.reagents, self._rcoefs):
-            r = r + '+' + str(coef) + ' ' + reag.inp_name + ' '
-        r = r + ' -> '
-        for (reag, coef) in zip(self.products, self._pcoefs):
-            r = r + '+' + str(coef) + ' ' + reag.inp_name + ' '
-        return """<reaction> {0}""".format(r)
+        reagents = ''.join('+{0} {1} '.format(coef, compound.inp_name)
+                           for (compound, coef) in
+                           zip(self.reagents, self._rcoefs))
+        products = ''.join('+{0} {1} '.format(coef, compound.inp_name)
+                           for (compound, coef) in
+                           zip(self.products, self._pcoefs))
+        return """<reaction> {0} -> {1}""".format(reagents, products)
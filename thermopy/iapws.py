@@ -11,163 +11,42 @@ Thermodynamic Properties of Water and Steam. August 2007.
 """
 
 from thermopy.units import Pressure, Temperature, Enthalpy
-from numpy import array, sum, sqrt, log
+from math import sqrt
+from numpy import array, ndarray, dot, log
 from thermopy.constants import ideal_gas_constant,                            \
-    ideal_gas_constant_massic_basis
+    ideal_gas_constant_massic_basis, mega
 import scipy.optimize
 
-
-class Water(object):
-    """
-    Taken from The International Association for the Properties of Water and
-    Steam. Lucerne, Switzerland. August 2007. Revised Release on the IAPWS
-    Industrial Formulation 1997 for the Thermodynamic Properties of Water and
-    Steam. Reference document: IAPWS-IF97.
-
-    All units in SI and default
-    is molar basis."""
-
-    def __init__(self, p, T, massic_basis=False):
-        u"""Initializes a Water object."""
-
-        self.p = Pressure(p)
-        self.T = Temperature(T)
-        # check if water is specified by IAPWS-IF97 for these values
-        if self.T < Temperature(273.15) or self.T > Temperature(2273.15):
-            raise ValueError('Temperature ' + str(T) +
-                             ' out of range (273.15 - 2273.15K)')
-        if self.p > Pressure(100).unit('MPa') or self.p < 0:
-            raise ValueError('Pressure ' + str(p) +
-                             ' out of range (0 - 100 MPa)')
-        if self.T > 1073.15 and self.p > Pressure(50).unit('MPa'):
-            raise ValueError('p or T value out of range')
-
-        # adjust R to mass or molar basis
-        if massic_basis is True:
-            self.R = ideal_gas_constant_massic_basis[0]  # kJ/(kg K);
-        elif massic_basis is False:
-            self.R = ideal_gas_constant[0]
-
-    # constants
-    # ideal gas constant was already instantiated
-    Tc = 647.096    # Critical point temperature (K)
-    pc = Pressure(22.064).unit('MPa')     # Critical point pressure (MPa)
-    rhoc = 322        # Critical point density kg/m3
-    Tt = 273.16     # Triple point temperature (K)
-    pt = 611.657    # Triple point pressure (Pa)
-    ht = 0.611783    # Enthalpy at triple point (J/kg)
-
-    def temperature_saturation(self, p=None):
-        """Yields Tsat given a pressure p."""
-        # module deals with pressure in MPa
-        if p is None:
-            p = self.p.MPa
-        else:
-            p = Pressure(p).MPa
-
-        if p < Pressure(611.213).unit('Pa').MPa or p > self.pc:
-            raise ValueError('Pressure out of range.')
-
-        # table 34
-        ni = array([1167.0521452767,
-                    -724213.16703206,
-                    -17.073846940092,
-                    12020.82470247,
-                    -3232555.0322333,
-                    14.91510861353,
-                    -4823.2657361591,
-                    405113.40542057,
-                    -0.23855557567849,
-                    650.17534844798], dtype='d')
-
-        beta = p ** 0.25
-
-        E = 1 * beta ** 2 + ni[2] * beta + ni[5]
-        F = ni[0] * beta ** 2 + ni[3] * beta + ni[6]
-        G = ni[1] * beta ** 2 + ni[4] * beta + ni[7]
-        D = 2 * G / (-F - (F**2 - 4 * E * G)**0.5)
-
-        return Temperature((ni[9] + D - ((ni[9] + D) ** 2 - 4 *
-                                         (ni[8] + ni[9] * D)) ** 0.5) * 0.5)
-
-    def pressure_saturation(self, T=None):
-        """Yields Psat given a temperature T"""
-        if T is None:
-            T = self.T
-        else:
-            T = Temperature(T)
-
-        if T < 273.15 or T > self.Tc:
-            raise ValueError('Temperature out of range.')
-
-        # table 34
-        ni = array([1167.0521452767,
-                    -724213.16703206,
-                    -17.073846940092,
-                    12020.82470247,
-                    -3232555.0322333,
-                    14.91510861353,
-                    -4823.2657361591,
-                    405113.40542057,
-                    -0.23855557567849,
-                    650.17534844798], dtype='d')
-
-        v = T + ni[8] / (T - ni[9])
-        A = 1 * v ** 2 + ni[0] * v + ni[1]
-        B = ni[2] * v ** 2 + ni[3] * v + ni[4]
-        C = ni[5] * v ** 2 + ni[6] * v + ni[7]
-        return Pressure((2 * C / (-B + (B ** 2 - 4 * A * C) ** 0.5)) ** 4
-                        ).unit('MPa')
-
-    def _is_in_region(self):
-        """Finds a region for the (T, p) point (see IAPWS-IF97 for details).
-        The usefulness of these regions are to divide the physical properties
-        of water into different sets of coefficients and equations."""
-
-        # for the 2 - 3 boundary line
-        ni = array([348.05185628969,
-                    -1.1671859879975,
-                    0.0010192970039326,
-                    572.54459862746,
-                    13.91883977887], dtype='d')
-
-        theta = self.T
-        pressure23 = Pressure(ni[0] + ni[1] * theta + ni[2] *
-                              theta ** 2).unit('MPa')
-        # exceptional cases
-        if self.T == self.Tt and self.p == self.pt:
-            return 1
-        # regular cases
-        if self.T >= Temperature(273.15) and self.T <= Temperature(623.15):
-            if self.T < self.temperature_saturation(self.p):
-                return 1
-            else:
-                return 2
-        elif self.T > Temperature(623.15) and self.T <= Temperature(1073.15):
-            if self.p > pressure23:
-                return 3
-            else:
-                return 2
-        elif self.T >= Temperature(1073.15) and self.T <= Temperature(2273.15):
-            return 5
-        else:
-            raise Exception('Cannot assign region to the parameters p = ' +
-                            str(self.p) + 'T = ' + str(self.T) + 'given.')
-
-    def _basic_equation1(self, value='gamma'):
-        """Returns basic equation 1 and its derivatives, ex: 'gamma',
-        'gamma_tau', 'gamma_tau_pi', etc."""
-        # region1
-        Ii = array([0, 0, 0, 0, 0, 0, 0, 0, 1,
+# coefficient tables of IAPWS-IF97, built once at import time; the
+# scalar-only ones are tuples of floats, which index faster than arrays
+# saturation line (table 34)
+_SATURATION_N = (1167.0521452767,
+                 -724213.16703206,
+                 -17.073846940092,
+                 12020.82470247,
+                 -3232555.0322333,
+                 14.91510861353,
+                 -4823.2657361591,
+                 405113.40542057,
+                 -0.23855557567849,
+                 650.17534844798)
+# boundary between regions 2 and 3 (table 1)
+_B23_N = (348.05185628969,
+          -1.1671859879975,
+          0.0010192970039326,
+          572.54459862746,
+          13.91883977887)
+# region 1 (table 2)
+_REGION1_I = array([0, 0, 0, 0, 0, 0, 0, 0, 1,
                     1, 1, 1, 1, 1, 2, 2, 2, 2,
                     2, 3, 3, 3, 4, 4, 4, 5, 8,
-                    8, 21, 23, 29, 30, 31, 32], dtype='int')
-        Ji = array([-2, -1, 0, 1, 2, 3, 4, 5,
+                    8, 21, 23, 29, 30, 31, 32], dtype='d')
+_REGION1_J = array([-2, -1, 0, 1, 2, 3, 4, 5,
                     -9, -7, -1, 0, 1, 3, -3,
                     0, 1, 3, 17, -4, 0, 6, -5,
                     -2, 10, -8, -11, -6, -29,
-                    -31, -38, -39, -40, -41], dtype='int')
-        ni = array([0.14632971213167,
+                    -31, -38, -39, -40, -41], dtype='d')
+_REGION1_N = array([0.14632971213167,
                     -0.84548187169114,
                     -3.756360367204,
                     3.3855169168385,
@@ -201,59 +80,32 @@ class Water(object):
                     -1.1947622640071e-23,
                     1.8228094581404e-24,
                     -9.3537087292458e-26], dtype='d')
-        pi = self.p / Pressure(16.53).unit('MPa')
-        tau = Temperature(1386) / self.T
-
-        if value == 'gamma':
-            return sum(ni * ((7.1 - pi) ** Ii) *
-                       ((tau - 1.222) ** Ji))
-        elif value == 'gamma_tau':
-            return sum(ni * ((7.1 - pi) ** Ii) * Ji *
-                       ((tau - 1.222) ** (Ji-1)))
-        elif value == 'gamma_tau_tau':
-            return sum(ni * ((7.1 - pi) ** Ii) * Ji * (Ji - 1) *
-                       ((tau - 1.222) ** (Ji - 2)))
-        elif value == 'gamma_pi':
-            return -1 * sum(ni * Ii * ((7.1 - pi) ** (Ii - 1)) *
-                            (tau - 1.222) ** Ji)
-        elif value == 'gamma_pi_pi':
-            return sum(ni * Ii * (Ii - 1) * (7.1 - pi) ** (Ii - 2) *
-                       (tau - 1.222) ** Ji)
-        elif value == 'gamma_pi_tau' or value == 'gamma_tau_pi':
-            return -1 * sum(ni * Ii * (7.1 - pi) ** (Ii - 1) *
-                            Ji * (tau - 1.222) ** (Ji - 1))
-        else:
-            raise Exception('Function not assigned in _basic_equation1()')
-
-    def _basic_equation2(self, value='gamma'):
-        """Returns equation 1 and its derivatives, ex: 'gamma', 'gamma_tau',
-        'gamma_tau_pi', etc."""
-        # region2; ideal part
-        J0 = array([0, 1, -5, -4, -3, -2, -1,
-                    2, 3], dtype='d')
-        n0 = array([-9.6927686500217,
-                    10.086655968018,
-                    -0.005608791128302,
-                    0.071452738081455,
-                    -0.40710498223928,
-                    1.4240819171444,
-                    -4.383951131945,
-                    -0.28408632460772,
-                    0.021268463753307], dtype='d')
-        # region2; real part
-        Ii = array([1, 1, 1, 1, 1, 2, 2, 2, 2,
+# region 2; ideal part (table 10)
+_REGION2_J0 = array([0, 1, -5, -4, -3, -2, -1,
+                     2, 3], dtype='d')
+_REGION2_N0 = array([-9.6927686500217,
+                     10.086655968018,
+                     -0.005608791128302,
+                     0.071452738081455,
+                     -0.40710498223928,
+                     1.4240819171444,
+                     -4.383951131945,
+                     -0.28408632460772,
+                     0.021268463753307], dtype='d')
+# region 2; real part (table 11)
+_REGION2_I = array([1, 1, 1, 1, 1, 2, 2, 2, 2,
                     2, 3, 3, 3, 3, 3, 4, 4, 4,
                     5, 6, 6, 6, 7, 7, 7, 8, 8,
                     9, 10, 10, 10, 16, 16, 18,
                     20, 20, 20, 21, 22, 23,
                     24, 24, 24], dtype='d')
-        Ji = array([0, 1, 2, 3, 6, 1, 2, 4, 7,
+_REGION2_J = array([0, 1, 2, 3, 6, 1, 2, 4, 7,
                     36, 0, 1, 3, 6, 35, 1, 2,
                     3, 7, 3, 16, 35, 0, 11,
                     25, 8, 36, 13, 4, 10, 14,
                     29, 50, 57, 20, 35, 48,
                     21, 53, 39, 26, 40, 58], dtype='d')
-        ni = array([-0.0017731742473213,
+_REGION2_N = array([-0.0017731742473213,
                     -0.017834862292358,
                     -0.045996013696365,
                     -0.057581259083432,
@@ -296,58 +148,20 @@ class Water(object):
                     7.3087610595061e-29,
                     5.5414715350778e-17,
                     -9.436970724121e-07], dtype='d')
-
-        pi = self.p / Pressure(1).unit('MPa')
-        tau = 540 / self.T
-        # arrays
-        if value == 'gamma':
-            return (self._basic_equation2('gamma_0') +
-                    self._basic_equation2('gamma_r'))
-        elif value == 'gamma_0':
-            return log(pi) + sum(n0 * (tau ** J0))
-        elif value == 'gamma_r':
-            return sum(ni * (pi ** Ii) * (tau - 0.5) ** Ji)
-        elif value == 'gamma_0_pi':
-            return 1/pi
-        elif value == 'gamme_0_pi_pi':
-            return -1/(pi ** 2)
-        elif value == 'gamma_0_tau':
-            return 0 + sum(n0 * J0 * (tau ** (J0 - 1)))
-        elif value == 'gamma_0_tau_tau':
-            return 0 + sum(n0 * J0 * (J0 - 1) * tau ** (J0 - 2))
-        elif value == 'gamma_0_pi_tau' or value == 'gamma_0_tau_pi':
-            return 0
-        elif value == 'gamma_r_pi':
-            return sum(ni * Ii * (pi ** (Ii - 1)) * ((tau - 0.5) ** Ji))
-        elif value == 'gamma_r_tau':
-            return sum(ni * (pi ** Ii) * Ji * (tau - 0.5) ** (Ji - 1))
-        elif value == 'gamma_r_pi_pi':
-            return sum(ni * Ii * (Ii - 1) * (pi ** (Ii - 2))
-                       (tau - 0.5) ** Ji)
-        elif value == 'gamma_r_tau_tau':
-            return sum(ni * (pi ** Ii) * Ji * (Ji - 1) * (tau - 0.5) **
-                       (Ji - 2))
-        elif value == 'gamma_pi_tau' or value == 'gamma_tau_pi':
-            pass
-
-    def _basic_equation3(self, value='PHI'):
-        """Returns equation 3 and its derivatives, ex: 'gamma',
-        'gamma_tau', 'gamma_tau_pi', etc."""
-        # do not forget that the first term is not used
-        Ii = array([-1, 0, 0, 0, 0, 0, 0, 0,
+# region 3 (table 30); the first term, n1 * ln(delta), is kept apart
+_REGION3_N1 = 1.0658070028513
+_REGION3_I = array([0, 0, 0, 0, 0, 0, 0,
                     1, 1, 1, 1, 2, 2, 2, 2, 2,
                     2, 3, 3, 3, 3, 3, 4, 4, 4,
                     4, 5, 5, 5, 6, 6, 6, 7, 8,
                     9, 9, 10, 10, 11], dtype='d')
-        # do not forget that the first term is not used
-        Ji = array([-1, 0, 1, 2, 7, 10, 12,
+_REGION3_J = array([0, 1, 2, 7, 10, 12,
                     23, 2, 6, 15, 17, 0, 2, 6,
                     7, 22, 26, 0, 2, 4, 16,
                     26, 0, 2, 4, 26, 1, 3, 26,
                     0, 2, 26, 2, 26, 2, 26, 0,
                     1, 26], dtype='d')
-        ni = array([1.0658070028513,
-                    -15.732845290239,
+_REGION3_N = array([-15.732845290239,
                     20.944396974307,
                     -7.6867707878716,
                     2.6185947787954,
@@ -386,48 +200,302 @@ class Water(object):
                     8.0964802996215e-05,
                     -0.00016557679795037,
                     -4.4923899061815e-05], dtype='d')
-        # it looks like the first term is never used
-        # except in the PHI equations
-        Ii = Ii[1:]
-        Ji = Ji[1:]
-        ni = ni[1:]
-        n1 = 1.0658070028513
+# region 5; ideal part (table 37)
+_REGION5_J0 = array([0, 1, -3, -2, -1, 2], dtype='d')
+_REGION5_N0 = array([-13.179983674201,
+                     6.8540841634434,
+                     -0.024805148933466,
+                     0.36901534980333,
+                     -3.1161318213925,
+                     -0.32961626538917], dtype='d')
+# region 5; real part (table 38)
+_REGION5_I = array([1, 1, 1, 2, 2, 3], dtype='d')
+_REGION5_J = array([1, 2, 3, 3, 9, 7], dtype='d')
+_REGION5_N = array([0.0015736404855259,
+                    0.00090153761673944,
+                    -0.0050270077677648,
+                    2.2440037409485e-06,
+                    -4.1163275453471e-06,
+                    3.7919454822955e-08], dtype='d')
+
+# exponents shifted for the first and second derivatives
+_REGION1_I1, _REGION1_I2 = _REGION1_I - 1, _REGION1_I - 2
+_REGION1_J1, _REGION1_J2 = _REGION1_J - 1, _REGION1_J - 2
+_REGION2_J01, _REGION2_J02 = _REGION2_J0 - 1, _REGION2_J0 - 2
+_REGION2_I1, _REGION2_I2 = _REGION2_I - 1, _REGION2_I - 2
+_REGION2_J1, _REGION2_J2 = _REGION2_J - 1, _REGION2_J - 2
+_REGION3_I1, _REGION3_I2 = _REGION3_I - 1, _REGION3_I - 2
+_REGION3_J1, _REGION3_J2 = _REGION3_J - 1, _REGION3_J - 2
+_REGION5_J01, _REGION5_J02 = _REGION5_J0 - 1, _REGION5_J0 - 2
+_REGION5_I1, _REGION5_I2 = _REGION5_I - 1, _REGION5_I - 2
+_REGION5_J1, _REGION5_J2 = _REGION5_J - 1, _REGION5_J - 2
+# reducing pressures (Pa) and temperatures (K) of the basic equations
+_REGION1_P, _REGION1_T = 16.53 * mega, 1386.0
+_REGION2_P, _REGION2_T = 1.0 * mega, 540.0
+_REGION5_P, _REGION5_T = 1.0 * mega, 1000.0
+# lowest pressure of the saturation line (MPa)
+_SATURATION_P_MIN = 611.213 / mega
+
+
+def _out_of_range(x, low, high):
+    """Tells if x, or any element of an array x, is outside [low, high]."""
+    if isinstance(x, ndarray):
+        return bool((x < low).any() or (x > high).any())
+    return x < low or x > high
+
 
+class Water(object):
+    """
+    Taken from The International Association for the Properties of Water and
+    Steam. Lucerne, Switzerland. August 2007. Revised Release on the IAPWS
+    Industrial Formulation 1997 for the Thermodynamic Properties of Water and
+    Steam. Reference document: IAPWS-IF97.
+
+    All units in SI and default
+    is molar basis."""
+
+    def __init__(self, p, T, massic_basis=False):
+        u"""Initializes a Water object."""
+
+        self.p = p if type(p) is Pressure else Pressure(p)
+        self.T = T if type(T) is Temperature else Temperature(T)
+        # check if water is specified by IAPWS-IF97 for these values
+        if self.T < 273.15 or self.T > 2273.15:
+            raise ValueError('Temperature ' + str(T) +
+                             ' out of range (273.15 - 2273.15K)')
+        if self.p > 100e6 or self.p < 0:
+            raise ValueError('Pressure ' + str(p) +
+                             ' out of range (0 - 100 MPa)')
+        if self.T > 1073.15 and self.p > 50e6:
+            raise ValueError('p or T value out of range')
+
+        # adjust R to mass or molar basis
+        if massic_basis is True:
+            self.R = ideal_gas_constant_massic_basis.value  # kJ/(kg K);
+        elif massic_basis is False:
+            self.R = ideal_gas_constant.value
+        # region 3 density solved for the current state, see _density3
+        self._rho3 = None
+
+    # constants
+    # ideal gas constant was already instantiated
+    Tc = 647.096    # Critical point temperature (K)
+    pc = Pressure(22.064).unit('MPa')     # Critical point pressure (MPa)
+    rhoc = 322        # Critical point density kg/m3
+    Tt = 273.16     # Triple point temperature (K)
+    pt = 611.657    # Triple point pressure (Pa)
+    ht = 0.611783    # Enthalpy at triple point (J/kg)
+
+    def temperature_saturation(self, p=None):
+        """Yields Tsat given a pressure p. An array of pressures in Pa
+        yields an array of temperatures in K."""
+        # module deals with pressure in MPa
+        if p is None:
+            p = self.p.MPa
+        else:
+            p = p / mega
+
+        if _out_of_range(p, _SATURATION_P_MIN, self.pc):
+            raise ValueError('Pressure out of range.')
+
+        ni = _SATURATION_N
+
+        # integer powers are spelled out as products; float ** 2 goes
+        # through the generic pow()
+        beta = p ** 0.25
+        beta2 = beta * beta
+
+        E = beta2 + ni[2] * beta + ni[5]
+        F = ni[0] * beta2 + ni[3] * beta + ni[6]
+        G = ni[1] * beta2 + ni[4] * beta + ni[7]
+        D = 2 * G / (-F - (F * F - 4 * E * G) ** 0.5)
+        nD = ni[9] + D
+        T = (nD - (nD * nD - 4 * (ni[8] + ni[9] * D)) ** 0.5) * 0.5
+
+        return T if isinstance(T, ndarray) else Temperature(T)
+
+    def pressure_saturation(self, T=None):
+        """Yields Psat given a temperature T. An array of temperatures in K
+        yields an array of pressures in Pa."""
+        if T is None:
+            T = self.T
+        elif not isinstance(T, ndarray):
+            T = T if type(T) is Temperature else Temperature(T)
+
+        if _out_of_range(T, 273.15, self.Tc):
+            raise ValueError('Temperature out of range.')
+
+        ni = _SATURATION_N
+
+        v = T + ni[8] / (T - ni[9])
+        v2 = v * v
+        A = v2 + ni[0] * v + ni[1]
+        B = ni[2] * v2 + ni[3] * v + ni[4]
+        C = ni[5] * v2 + ni[6] * v + ni[7]
+        x = 2 * C / (-B + (B * B - 4 * A * C) ** 0.5)
+        x2 = x * x
+        if isinstance(x2, ndarray):
+            return x2 * x2 * mega
+        return Pressure(x2 * x2).unit('MPa')
+
+    def _is_in_region(self):
+        """Finds a region for the (T, p) point (see IAPWS-IF97 for details).
+        The usefulness of these regions are to divide the physical properties
+        of water into different sets of coefficients and equations."""
+
+        ni = _B23_N
+
+        theta = self.T
+        pressure23 = (ni[0] + ni[1] * theta + ni[2] * theta * theta) * mega
+        # exceptional cases
+        if self.T == self.Tt and self.p == self.pt:
+            return 1
+        # regular cases
+        if self.T >= 273.15 and self.T <= 623.15:
+            if self.T < self.temperature_saturation(self.p):
+                return 1
+            else:
+                return 2
+        elif self.T > 623.15 and self.T <= 1073.15:
+            if self.p > pressure23:
+                return 3
+            else:
+                return 2
+        elif self.T >= 1073.15 and self.T <= 2273.15:
+            return 5
+        else:
+            raise Exception('Cannot assign region to the parameters p = ' +
+                            str(self.p) + 'T = ' + str(self.T) + 'given.')
+
+    def _basic_equation1(self, value='gamma'):
+        """Returns basic equation 1 and its derivatives, ex: 'gamma',
+        'gamma_tau', 'gamma_tau_pi', etc."""
+        Ii, Ji, ni = _REGION1_I, _REGION1_J, _REGION1_N
+        Ii1, Ii2, Ji1, Ji2 = _REGION1_I1, _REGION1_I2, _REGION1_J1, _REGION1_J2
+        pi = self.p / _REGION1_P
+        tau = _REGION1_T / self.T
+
+        if value == 'gamma':
+            return dot(ni, ((7.1 - pi) ** Ii) *
+                       ((tau - 1.222) ** Ji))
+        elif value == 'gamma_tau':
+            return dot(ni, ((7.1 - pi) ** Ii) * Ji *
+                       ((tau - 1.222) ** Ji1))
+        elif value == 'gamma_tau_tau':
+            return dot(ni, ((7.1 - pi) ** Ii) * Ji * Ji1 *
+                       ((tau - 1.222) ** Ji2))
+        elif value == 'gamma_pi':
+            return -1 * dot(ni, Ii * ((7.1 - pi) ** Ii1) *
+                            (tau - 1.222) ** Ji)
+        elif value == 'gamma_pi_pi':
+            return dot(ni, Ii * Ii1 * (7.1 - pi) ** Ii2 *
+                       (tau - 1.222) ** Ji)
+        elif value == 'gamma_pi_tau' or value == 'gamma_tau_pi':
+            return -1 * dot(ni, Ii * (7.1 - pi) ** Ii1 *
+                            Ji * (tau - 1.222) ** Ji1)
+        else:
+            raise Exception('Function not assigned in _basic_equation1()')
+
+    def _basic_equation2(self, value='gamma'):
+        """Returns equation 1 and its derivatives, ex: 'gamma', 'gamma_tau',
+        'gamma_tau_pi', etc."""
+        J0, n0 = _REGION2_J0, _REGION2_N0
+        Ii, Ji, ni = _REGION2_I, _REGION2_J, _REGION2_N
+        J01, J02 = _REGION2_J01, _REGION2_J02
+        Ii1, Ii2, Ji1, Ji2 = _REGION2_I1, _REGION2_I2, _REGION2_J1, _REGION2_J2
+
+        pi = self.p / _REGION2_P
+        tau = _REGION2_T / self.T
+        # arrays
+        if value == 'gamma':
+            return (self._basic_equation2('gamma_0') +
+                    self._basic_equation2('gamma_r'))
+        elif value == 'gamma_0':
+            return log(pi) + dot(n0, (tau ** J0))
+        elif value == 'gamma_r':
+            return dot(ni, (pi ** Ii) * (tau - 0.5) ** Ji)
+        elif value == 'gamma_0_pi':
+            return 1/pi
+        elif value == 'gamme_0_pi_pi':
+            return -1/(pi ** 2)
+        elif value == 'gamma_0_tau':
+            return 0 + dot(n0, J0 * (tau ** J01))
+        elif value == 'gamma_0_tau_tau':
+            return 0 + dot(n0, J0 * J01 * tau ** J02)
+        elif value == 'gamma_0_pi_tau' or value == 'gamma_0_tau_pi':
+            return 0
+        elif value == 'gamma_r_pi':
+            return dot(ni, Ii * (pi ** Ii1) * ((tau - 0.5) ** Ji))
+        elif value == 'gamma_r_tau':
+            return dot(ni, (pi ** Ii) * Ji * (tau - 0.5) ** Ji1)
+        elif value == 'gamma_r_pi_pi':
+            return dot(ni, Ii * Ii1 * (pi ** Ii2)
+                       (tau - 0.5) ** Ji)
+        elif value == 'gamma_r_tau_tau':
+            return dot(ni, (pi ** Ii) * Ji * Ji1 * (tau - 0.5) ** Ji2)
+        elif value == 'gamma_pi_tau' or value == 'gamma_tau_pi':
+            pass
+
+    def _density3(self):
+        """Returns the region 3 density for the current (p, T). The root
+        search is kept until p, T or R change, so the PHI derivatives used
+        by one property share it."""
+        state = (self.p, self.T, self.R)
+        if self._rho3 is not None and self._rho3[0] == state:
+            return self._rho3[1]
+
+        Ii, Ji, ni = _REGION3_I, _REGION3_J, _REGION3_N
+        Ii1 = _REGION3_I1
+        n1 = _REGION3_N1
         tau = self.Tc / self.T
         # from equations 28 and p given as input,
         # calculate rho to be used in PHI
 
+        # the tau part of each term does not depend on the density
+        nIt = ni * Ii * tau ** Ji
+
         def obj(x):
             return (self.p - 1000 * x * self.R * self.T * (x / self.rhoc) *
-                    (n1 / (x / self.rhoc) + sum(
-                        ni * Ii * (x / self.rhoc) ** (Ii - 1) * tau ** Ji)))
+                    (n1 / (x / self.rhoc) + dot(nIt, (x / self.rhoc) ** Ii1)))
         for i in range(1, 580, 1):
             a = i
             b = a + 1
             if obj(a) * obj(b) < 0:
                 break
         rho = scipy.optimize.bisect(obj, a, b, xtol=1e-10)
+        self._rho3 = (state, rho)
+        return rho
+
+    def _basic_equation3(self, value='PHI'):
+        """Returns equation 3 and its derivatives, ex: 'gamma',
+        'gamma_tau', 'gamma_tau_pi', etc."""
+        Ii, Ji, ni = _REGION3_I, _REGION3_J, _REGION3_N
+        Ii1, Ii2, Ji1, Ji2 = _REGION3_I1, _REGION3_I2, _REGION3_J1, _REGION3_J2
+        n1 = _REGION3_N1
+
+        tau = self.Tc / self.T
+        rho = self._density3()
         delta = rho / self.rhoc
 
         # returns PHI and found rho as tuple (PHI, rho)
         if value == 'PHI':
-            return (n1 * log(delta) + sum(ni * delta ** Ii * tau ** Ji),
+            return (n1 * log(delta) + dot(ni, delta ** Ii * tau ** Ji),
                     rho)
         elif value == 'PHI_delta':
-            return (n1 / delta + sum(ni * Ii * delta ** (Ii - 1) * tau ** Ji),
+            return (n1 / delta + dot(ni, Ii * delta ** Ii1 * tau ** Ji),
                     rho)
         elif value == 'PHI_delta_delta':
-            return (-n1 / (delta ** 2) + sum(ni * Ii * (Ii - 1) * delta **
-                                             (Ii - 2) * tau ** Ji),
+            return (-n1 / (delta ** 2) + dot(ni, Ii * Ii1 * delta ** Ii2 *
+                                             tau ** Ji),
                     rho)
         elif value == 'PHI_tau':
-            return (sum(ni * delta ** Ii * Ji * tau ** (Ji - 1)),
+            return (dot(ni, delta ** Ii * Ji * tau ** Ji1),
                     rho)
         elif value == 'PHI_tau_tau':
-            return (sum(ni * delta ** Ii * Ji * (Ji - 1) * tau ** (Ji - 2)),
+            return (dot(ni, delta ** Ii * Ji * Ji1 * tau ** Ji2),
                     rho)
         elif value == 'PHI_delta_tau' or value == 'PHI_tau_delta':
-            return (sum(ni * Ii * delta ** (Ii - 1) * Ji * tau ** (Ji - 1)),
+            return (dot(ni, Ii * delta ** Ii1 * Ji * tau ** Ji1),
                     rho)
 
     # there is no region 4; region 4 is the saturation line of water/vapor
@@ -435,72 +503,62 @@ class Water(object):
     def _basic_equation5(self, value='gamma'):
         """Returns equation 1 and its derivatives, ex: 'gamma',
         'gamma_tau', 'gamma_tau_pi', etc."""
-        J0 = array([0, 1, -3, -2, -1, 2], dtype='d')
-        n0 = array([-13.179983674201,
-                    6.8540841634434,
-                    -0.024805148933466,
-                    0.36901534980333,
-                    -3.1161318213925,
-                    -0.32961626538917], dtype='d')
-        Ii = array([1, 1, 1, 2, 2, 3], dtype='d')
-        Ji = array([1, 2, 3, 3, 9, 7], dtype='d')
-        ni = array([0.0015736404855259,
-                    0.00090153761673944,
-                    -0.0050270077677648,
-                    2.2440037409485e-06,
-                    -4.1163275453471e-06,
-                    3.7919454822955e-08], dtype='d')
-        pi = self.p / Pressure(1).unit('MPa')
-        tau = Temperature(1000) / self.T
+        J0, n0 = _REGION5_J0, _REGION5_N0
+        Ii, Ji, ni = _REGION5_I, _REGION5_J, _REGION5_N
+        J01, J02 = _REGION5_J01, _REGION5_J02
+        Ii1, Ii2, Ji1, Ji2 = _REGION5_I1, _REGION5_I2, _REGION5_J1, _REGION5_J2
+        pi = self.p / _REGION5_P
+        tau = _REGION5_T / self.T
 
         if value == 'gamma':
             return (self._basic_equation5('gamma_0')
                     + self._basic_equation5('gamma_r'))
         elif value == 'gamma_0':
-            return log(pi) + sum(n0 * (tau ** J0))
+            return log(pi) + dot(n0, (tau ** J0))
         elif value == 'gamma_r':
-            return sum(ni * (pi ** Ii) * (tau ** Ji))
+            return dot(ni, (pi ** Ii) * (tau ** Ji))
         elif value == 'gamma_0_pi':
             return 1 / pi
         elif value == 'gamma_0_pi_pi':
             return -1 / (pi ** 2)
         elif value == 'gamma_0_tau':
-            return sum(n0 * J0 * (tau ** (J0 - 1)))
+            return dot(n0, J0 * (tau ** J01))
         elif value == 'gamma_0_tau_tau':
-            sum(n0 * J0 * (J0 - 1) * (tau ** (J0 - 2)))
+            dot(n0, J0 * J01 * (tau ** J02))
         elif value == 'gamma_0_tau_pi' or value == 'gamma_0_pi_tau':
             return 0 + 0
         elif value == 'gamma_r_pi':
-            return sum(ni * Ii * (pi ** (Ii - 1)) * (tau ** Ji))
+            return dot(ni, Ii * (pi ** Ii1) * (tau ** Ji))
         elif value == 'gamma_r_tau':
-            return sum(ni * (pi ** Ii) * Ji * (tau ** (Ji - 1)))
+            return dot(ni, (pi ** Ii) * Ji * (tau ** Ji1))
         elif value == 'gamma_r_pi_pi':
-            return sum(ni * Ii * (Ii - 1) * (pi ** (Ii - 2)) * (tau ** Ji))
+            return dot(ni, Ii * Ii1 * (pi ** Ii2) * (tau ** Ji))
         elif value == 'gamma_r_tau_tau':
-            return sum(ni * (pi ** Ii) * Ji * (Ji - 1) * (tau ** (Ji - 2)))
+            return dot(ni, (pi ** Ii) * Ji * Ji1 * (tau ** Ji2))
         elif value == 'gamma_r_tau_pi' or 'gamma_r_pi_tau':
-            return sum(ni * Ii * (pi ** (Ii - 1)) * Ji * (tau ** (Ji - 1)))
+            return dot(ni, Ii * (pi ** Ii1) * Ji * (tau ** Ji1))
 
     def gibbs_energy(self, p=None, T=None):
         """Returns the Gibbs Energy given p and T in kJ/kg."""
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
+        region = self._is_in_region()
+        if region == 1:
             return self._basic_equation1('gamma') * self.R * T
-        elif self._is_in_region() == 2:
+        elif region == 2:
             return self._basic_equation2('gamma') * self.R * T
-        elif self._is_in_region() == 3:
+        elif region == 3:
             pass
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
     def specific_volume(self, p=None, T=None):
@@ -508,26 +566,27 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            pi = self.p / Pressure(16.53).unit('MPa')
+        region = self._is_in_region()
+        if region == 1:
+            pi = self.p / _REGION1_P
             return (self._basic_equation1('gamma_pi') * self.R * self.T * pi
                     / self.p * 1e3)  # because of kJ in R
-        elif self._is_in_region() == 2:
-            pi = self.p / Pressure(1).unit('MPa')
+        elif region == 2:
+            pi = self.p / _REGION2_P
             return (pi * (self._basic_equation2('gamma_0_pi') +
                           self._basic_equation2('gamma_r_pi')) * self.R
                     * self.T / self.p * 1e3)
-        elif self._is_in_region() == 3:
+        elif region == 3:
             return None
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
         return -1
@@ -537,30 +596,31 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            pi = self.p / Pressure(16.53).unit('MPa')
-            tau = Temperature(1386) / self.T
+        region = self._is_in_region()
+        if region == 1:
+            pi = self.p / _REGION1_P
+            tau = _REGION1_T / self.T
             return (tau * self._basic_equation1('gamma_tau') - pi *
                     self._basic_equation1('gamma_pi')) * self.R * self.T
 
-        elif self._is_in_region() == 2:
-            pi = self.p / Pressure(1).unit('MPa')
-            tau = 540 / self.T
+        elif region == 2:
+            pi = self.p / _REGION2_P
+            tau = _REGION2_T / self.T
             return (tau * (self._basic_equation2('gamma_0_tau') +
                            self._basic_equation2('gamma_r_tau')) - pi *
                     (self._basic_equation2('gamma_0_pi') +
                      self._basic_equation2('gamma_r_pi'))) * self.R * self.T
-        elif self._is_in_region() == 3:
+        elif region == 3:
             pass
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
         return -1
@@ -570,29 +630,30 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            pi = self.p / Pressure(16.53).unit('MPa')
-            tau = Temperature(1386) / self.T
+        region = self._is_in_region()
+        if region == 1:
+            pi = self.p / _REGION1_P
+            tau = _REGION1_T / self.T
             return (tau * self._basic_equation1('gamma_tau') -
                     self._basic_equation1('gamma')) * self.R
-        elif self._is_in_region() == 2:
-            pi = self.p / Pressure(1).unit('MPa')
-            tau = 540 / self.T
+        elif region == 2:
+            pi = self.p / _REGION2_P
+            tau = _REGION2_T / self.T
             return ((tau * (self._basic_equation2('gamma_0_tau') +
                             self._basic_equation2('gamma_r_tau')) -
                      (self._basic_equation2('gamma_0') +
                       self._basic_equation2('gamma_r'))) * self.R)
-        elif self._is_in_region() == 3:
+        elif region == 3:
             pass
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
         return -1
@@ -602,22 +663,23 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
+        region = self._is_in_region()
+        if region == 1:
             return Enthalpy(self._basic_equation1('gamma_tau')
-                            * 1386 * self.R)
+                            * _REGION1_T * self.R)
 
-        elif self._is_in_region() == 2:
-            return Enthalpy(540 * self.R * (
+        elif region == 2:
+            return Enthalpy(_REGION2_T * self.R * (
                             self._basic_equation2('gamma_0_tau') +
                             self._basic_equation2('gamma_r_tau')))
 
-        elif self._is_in_region() == 3:
+        elif region == 3:
             # for region 3 rho needs to be solved numerically
             reg3_solved = self._basic_equation3('PHI_delta')
             delta = reg3_solved[1] / self.rhoc
@@ -625,12 +687,12 @@ class Water(object):
             return Enthalpy((tau * self._basic_equation3('PHI_tau')[0]
                              + delta * reg3_solved[0]) * self.R * self.T)
 
-        elif self._is_in_region() == 4:
+        elif region == 4:
             return None
 
-        elif self._is_in_region() == 5:
-            pi = self.p / Pressure(1).unit('MPa')
-            tau = Temperature(1000) / self.T
+        elif region == 5:
+            pi = self.p / _REGION5_P
+            tau = _REGION5_T / self.T
             return (tau * (self._basic_equation5('gamma_0_tau') +
                            self._basic_equation5('gamma_r_tau')) * self.R *
                     self.T)
@@ -640,19 +702,20 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            tau = 1386 / T
+        region = self._is_in_region()
+        if region == 1:
+            tau = _REGION1_T / T
             return (-1 * tau * tau * self.R *
                     self._basic_equation1('gamma_tau_tau'))
-        elif self._is_in_region() == 2:
+        elif region == 2:
             pass
-        elif self._is_in_region() == 3:
+        elif region == 3:
             delta = rho / self.rhoc
             tau = self.Tc / self.T
             return (- tau ** 2 / self._basic_equation3('PHI_tau_tau') +
@@ -662,9 +725,9 @@ class Water(object):
                             delta ** 2 * self._basic_equation3(
                                 'PHI_delta_delta'))
                     ) * self.R
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
         return -1
@@ -674,26 +737,27 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            pi = self.p / Pressure(16.53).unit('MPa')
-            tau = Temperature(1386) / self.T
+        region = self._is_in_region()
+        if region == 1:
+            pi = self.p / _REGION1_P
+            tau = _REGION1_T / self.T
             return (- (tau ** 2) * self._basic_equation1('gamma_tau_tau') +
                     ((self._basic_equation1('gamma_pi') - tau *
                       self._basic_equation1('gamma_pi_tau')) ** 2) /
                     self._basic_equation1('gamma_pi_pi')) * self.R
-        elif self._is_in_region() == 2:
+        elif region == 2:
             pass
-        elif self._is_in_region() == 3:
+        elif region == 3:
             pass
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
 
         return -1
@@ -703,15 +767,16 @@ class Water(object):
         if p is None:
             p = self.p
         else:
-            p = Pressure(p)
+            p = p if type(p) is Pressure else Pressure(p)
         if T is None:
             T = self.T
         else:
-            T = Temperature(T)
+            T = T if type(T) is Temperature else Temperature(T)
 
-        if self._is_in_region() == 1:
-            pi = self.p / Pressure(16.53).unit('MPa')
-            tau = Temperature(1386) / self.T
+        region = self._is_in_region()
+        if region == 1:
+            pi = self.p / _REGION1_P
+            tau = _REGION1_T / self.T
             inside_frac = (((self._basic_equation1('gamma_pi') - tau *
                              self._basic_equation1('gamma_tau_pi')) ** 2) /
                            ((tau ** 2) *
@@ -721,12 +786,12 @@ class Water(object):
                           inside_frac - self._basic_equation1('gamma_pi_pi'))
                          ) * self.R * self.T * 1000)
 
-        elif self._is_in_region() == 2:
+        elif region == 2:
             pass
-        elif self._is_in_region() == 3:
+        elif region == 3:
             pass
-        elif self._is_in_region() == 4:
+        elif region == 4:
             pass
-        elif self._is_in_region() == 5:
+        elif region == 5:
             pass
         return -1
@@ -50,7 +50,7 @@ import re
 import xml.etree.ElementTree as ET
 import numpy as np
 from thermopy.constants import ideal_gas_constant
-_R = ideal_gas_constant[0]
+_R = ideal_gas_constant.value
 
 
 class Compound(object):
@@ -902,10 +902,10 @@ class Reaction(object):
 
     def __repr__(self):
         u"""Define how a reaction should be print."""
-        r = ''
-        for (reag, coef) in zip(self._reactants, self._rcoefs):
-            r = r + '+' + str(coef) + ' ' + reag.inp_name + ' '
-        r = r + ' -> '
-        for (reag, coef) in zip(self._products, self._pcoefs):
-            r = r + '+' + str(coef) + ' ' + reag.inp_name + ' '
-        return """<reaction> {0}""".format(r)
+        reagents = ''.join('+{0} {1} '.format(coef, compound.inp_name)
+                           for (compound, coef) in
+                           zip(self._reactants, self._rcoefs))
+        products = ''.join('+{0} {1} '.format(coef, compound.inp_name)
+                           for (compound, coef) in
+                           zip(self._products, self._pcoefs))
+        return """<reaction> {0} -> {1}""".format(reagents, products)
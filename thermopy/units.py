@@ -80,16 +80,16 @@ class Temperature(float):
         """
         return cls(data)
 
+    # conversions to Kelvin by unit code
+    _to_si = {'K': float, 'C': constants.C2K, 'F': constants.F2K}
+
     def unit(self, units='K'):
         u"""Set unit for temperature."""
-        if units == 'K':
-            return self.__factory(self.data)
-        elif units == 'C':
-            return self.__factory(constants.C2K(self.data))
-        elif units == 'F':
-            return self.__factory(constants.F2K(self.data))
-        else:
-            raise ValueError("Wrong temperature input code")
+        try:
+            to_si = self._to_si[units]
+        except KeyError:
+            raise ValueError("Wrong temperature input code") from None
+        return self.__factory(to_si(self.data))
 
     @property
     def C(self):
@@ -148,24 +148,22 @@ class Pressure(float):
         """
         return cls(data)
 
+    # factors to Pa by unit code
+    _to_si = {'Pa': 1.0,
+              'MPa': constants.mega,
+              'bar': constants.bar,
+              'psi': constants.psi,
+              'atm': constants.atm,
+              'mmwc': constants.torr * 1000 / 13534,
+              'torr': constants.torr}
+
     def unit(self, units='Pa'):
         u"""Set unit for pressure."""
-        if units == 'Pa':
-            return self.__factory(self.data)
-        elif units == 'MPa':
-            return self.__factory(constants.mega * self.data)
-        elif units == 'bar':
-            return self.__factory(self.data * constants.bar)
-        elif units == 'psi':
-            return self.__factory(self.data * constants.psi)
-        elif units == 'atm':
-            return self.__factory(self.data * constants.atm)
-        elif units == 'mmwc':
-            return self.__factory(self.data * (constants.torr * 1000 / 13534))
-        elif units == 'torr':
-            return self.__factory(self.data * constants.torr)
-        else:
-            raise ValueError("wrong pressure unit input code")
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong pressure unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def MPa(self):
@@ -235,18 +233,19 @@ class Enthalpy(float):
         """
         return cls(data)
 
+    # factors to J/kg by unit code
+    _to_si = {'si': 1.0,
+              'kJkg': constants.kilo,
+              'kcalkg': constants.calorie * constants.kilo,
+              'Btulb': constants.Btu / constants.lb}
+
     def unit(self, units='si'):
         u"""Set unit for Enthalpy."""
-        if units == 'si':
-            return self.__factory(self.data)
-        elif units == 'kJkg':
-            return self.__factory(self.data * constants.kilo)
-        elif units == 'kcalkg':
-            return self.__factory(self.data * constants.calorie *
-                                  constants.kilo)
-        elif units == 'Btulb':
-            return self.__factory(self.data * constants.Btu / constants.lb)
-        raise ValueError("wrong enthalpy unit input code")
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong enthalpy unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def kJkg(self):
@@ -300,18 +299,19 @@ class Length(float):
         """
         return cls(data)
 
+    # factors to m by unit code
+    _to_si = {'m': 1.0,
+              'mm': constants.milli,
+              'inch': constants.inch,
+              'ft': constants.foot}
+
     def unit(self, units='m'):
         u"""Set unit for length."""
-        if units == 'm':
-            return self.__factory(self.data)
-        elif units == 'mm':
-            return self.__factory(self.data * constants.milli)
-        elif units == 'inch':
-            return self.__factory(self.data * constants.inch)
-        elif units == 'ft':
-            return self.__factory(self.data * constants.foot)
-        else:
-            raise ValueError("wrong length unit input code")
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong length unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def mm(self):
@@ -356,18 +356,19 @@ class Massflow(float):
         """
         return cls(data)
 
+    # factors to kg/s by unit code
+    _to_si = {'kgs': 1.0,
+              'kgh': 1 / constants.hour,
+              'lbs': constants.lb,
+              'lbh': constants.lb / constants.hour}
+
     def unit(self, units='kgs'):
         u"""Set unit for massflow."""
-        if units == 'kgs':
-            return self.__factory(self.data)
-        elif units == 'kgh':
-            return self.__factory(self.data / constants.hour)
-        elif units == 'lbs':
-            return self.__factory(self.data * constants.lb)
-        elif units == 'lbh':
-            return self.__factory(self.data * constants.lb / constants.hour)
-        else:
-            raise ValueError("wrong massflow unit input code")
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong massflow unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def kgh(self):
@@ -408,15 +409,17 @@ class Massflowrate(float):
         """
         return cls(data)
 
+    # factors to kg/(s m^2) by unit code
+    _to_si = {'default': 1.0,
+              'Btu': constants.lb / constants.foot ** 2}
+
     def unit(self, units='default'):
         u"""Set unit for massflowrate."""
-        if units == 'default':
-            return self.__factory(self.data)
-        elif units == 'Btu':
-            return self.__factory(self.data * constants.lb /
-                                  constants.foot ** 2)
-        else:
-            raise ValueError("wrong massflow unit input code")
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong massflow unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def Btu(self):
@@ -438,14 +441,21 @@ class Energy(float):
         """
         return cls(data)
 
+    # factors to J by unit code, Btu is case insensitive
+    _to_si = {'J': 1.0,
+              'BTU': constants.Btu,
+              'cal': constants.calorie,
+              'kWh': constants.kWh}
+
     def unit(self, units='J'):
         u"""Set unit for energy."""
         if units.upper() == 'BTU':
-            return self.__factory(self.data * constants.Btu)
-        elif units == 'cal':
-            return self.__factory(self.data * constants.calorie)
-        elif units == 'kWh':
-            return self.__factory(self.data * constants.kWh)
+            units = 'BTU'
+        try:
+            factor = self._to_si[units]
+        except KeyError:
+            raise ValueError("wrong energy unit input code") from None
+        return self.__factory(self.data * factor)
 
     @property
     def Btu(self):